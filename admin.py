@@ -1,9 +1,97 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import Count, Q
+from django.db.models.expressions import RawSQL
+from django.utils.functional import cached_property
 from .models import (
     User, Role, MasterShows, ListGenre, ShowGenreMapping,
     MediaStatusLog, MediaPopularity, Category, Article, MediaFile
 )
+from .signals import (
+    CATEGORY_ARTICLE_COUNTS_KEY, GENRE_SHOW_COUNTS_KEY, ADMIN_COUNTS_TIMEOUT
+)
+
+
+def _fulltext_prefix(search_term):
+    """Format search term sebagai prefix term untuk CONTAINS() SQL Server"""
+    return '"%s*"' % search_term.replace('"', '""')
+
+
+def _cached_counts(key, counts_queryset):
+    """Ambil {pk: count} dari cache, atau hitung sekali dari `counts_queryset`"""
+    counts = cache.get(key)
+    if counts is None:
+        counts = dict(counts_queryset)
+        cache.set(key, counts, ADMIN_COUNTS_TIMEOUT)
+    return counts
+
+
+class CachedCountChangeList(ChangeList):
+    """
+    ChangeList dengan kolom count dari cache. Dict count diambil sekali per
+    halaman; JOIN + GROUP BY hanya ditambahkan kalau diurutkan berdasarkan
+    kolom count (model admin mendefinisikan count_column, count_attr,
+    count_relation dan counts_cache_key).
+    """
+    
+    def get_queryset(self, request, exclude_parameters=None):
+        # Index kolom sama dengan yang dipakai ChangeList untuk parameter `o`
+        # (sudah termasuk action_checkbox)
+        model_admin = self.model_admin
+        count_index = self.list_display.index(model_admin.count_column)
+        if (count_index in self.get_ordering_field_columns()
+                and model_admin.count_attr not in self.root_queryset.query.annotations):
+            self.root_queryset = self.root_queryset.annotate(
+                **{model_admin.count_attr: Count(model_admin.count_relation)}
+            )
+        return super().get_queryset(request, exclude_parameters)
+    
+    def get_results(self, request):
+        super().get_results(request)
+        model_admin = self.model_admin
+        if model_admin.count_attr in self.queryset.query.annotations:
+            return
+        counts = _cached_counts(
+            model_admin.counts_cache_key,
+            self.model._default_manager.annotate(
+                c=Count(model_admin.count_relation)
+            ).values_list('pk', 'c')
+        )
+        # result_list tetap queryset; objek yang sudah di-cache dipakai template
+        for obj in self.result_list:
+            setattr(obj, model_admin.count_attr, counts.get(obj.pk, 0))
+
+
+# ============================================================================
+# PAGINATION
+# ============================================================================
+
+class LargeTablePaginator(Paginator):
+    """Paginator dengan estimasi row count dari SQL Server untuk tabel besar"""
+    
+    @cached_property
+    def count(self):
+        # Estimasi hanya valid kalau queryset tidak difilter
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return super().count
+        
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT SUM(row_count)
+                FROM sys.dm_db_partition_stats
+                WHERE object_id = OBJECT_ID(%s) AND index_id IN (0, 1)
+            """, [self.object_list.model._meta.db_table])
+            row = cursor.fetchone()
+        
+        if row is None or row[0] is None:
+            return super().count
+        return row[0]
+
 
 # ============================================================================
 # USER & ROLE ADMIN
@@ -19,6 +107,7 @@ class RoleAdmin(admin.ModelAdmin):
 class UserAdmin(BaseUserAdmin):
     list_display = ['email', 'name', 'role', 'is_active', 'created_at']
     list_filter = ['role', 'is_active', 'created_at']
+    list_select_related = ['role']
     search_fields = ['email', 'name']
     ordering = ['-created_at']
     
@@ -47,18 +136,28 @@ class ShowGenreMappingInline(admin.TabularInline):
     model = ShowGenreMapping
     extra = 1
     raw_id_fields = ['genre']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('genre')
 
 
 @admin.register(MasterShows)
 class MasterShowsAdmin(admin.ModelAdmin):
-    list_display = ['show_id', 'title', 'release_year', 'first_source_table', 'get_status']
+    list_display = ['show_id', 'title', 'release_year', 'first_source_table', 'genre_names', 'get_status']
     list_filter = ['release_year', 'first_source_table']
     search_fields = ['title', 'first_source_id']
     ordering = ['-release_year', 'title']
-    readonly_fields = ['show_id', 'first_source_table', 'first_source_id']
+    readonly_fields = ['show_id', 'first_source_table', 'first_source_id',
+                       'genre_names', 'search_count']
+    paginator = LargeTablePaginator
+    show_full_result_count = False
     
     inlines = [ShowGenreMappingInline]
     
+    def get_queryset(self, request):
+        # Join status log sekali di changelist, bukan satu query per baris
+        return super().get_queryset(request).select_related('mediastatuslog')
+    
     def get_status(self, obj):
         try:
             return obj.mediastatuslog.recovery_status
@@ -66,6 +165,19 @@ class MasterShowsAdmin(admin.ModelAdmin):
             return 'Unknown/Lost'
     get_status.short_description = 'Recovery Status'
     
+    def get_search_results(self, request, queryset, search_term):
+        # Title dicari lewat FULLTEXT index Master_Shows(Title), bukan LIKE '%q%'
+        if not search_term:
+            return super().get_search_results(request, queryset, search_term)
+        matches = RawSQL(
+            "SELECT Show_ID FROM Master_Shows WHERE CONTAINS(Title, %s)",
+            [_fulltext_prefix(search_term)]
+        )
+        queryset = queryset.filter(
+            Q(show_id__in=matches) | Q(first_source_id__icontains=search_term)
+        )
+        return queryset, False
+    
     def has_add_permission(self, request):
         # Disable add karena data dari integrasi
         return False
@@ -80,10 +192,18 @@ class ListGenreAdmin(admin.ModelAdmin):
     list_display = ['genre_id', 'genre_name', 'get_show_count']
     search_fields = ['genre_name']
     ordering = ['genre_name']
+    count_column = 'get_show_count'
+    count_attr = '_show_count'
+    count_relation = 'showgenremapping'
+    counts_cache_key = GENRE_SHOW_COUNTS_KEY
+    
+    def get_changelist(self, request, **kwargs):
+        return CachedCountChangeList
     
     def get_show_count(self, obj):
-        return ShowGenreMapping.objects.filter(genre=obj).count()
+        return obj._show_count
     get_show_count.short_description = 'Total Shows'
+    get_show_count.admin_order_field = '_show_count'
     
     def has_add_permission(self, request):
         return False
@@ -97,6 +217,7 @@ class ListGenreAdmin(admin.ModelAdmin):
 class MediaStatusLogAdmin(admin.ModelAdmin):
     list_display = ['show', 'recovery_status', 'last_updated']
     list_filter = ['recovery_status', 'last_updated']
+    list_select_related = ['show']
     search_fields = ['show__title']
     readonly_fields = ['last_updated']
     raw_id_fields = ['show']
@@ -108,6 +229,7 @@ class MediaStatusLogAdmin(admin.ModelAdmin):
 @admin.register(MediaPopularity)
 class MediaPopularityAdmin(admin.ModelAdmin):
     list_display = ['get_show_title', 'search_count']
+    list_select_related = ['id']
     search_fields = ['id__title']
     ordering = ['-search_count']
     readonly_fields = ['id']
@@ -129,10 +251,18 @@ class CategoryAdmin(admin.ModelAdmin):
     list_display = ['id', 'name', 'slug', 'get_article_count']
     search_fields = ['name', 'slug']
     prepopulated_fields = {'slug': ('name',)}
+    count_column = 'get_article_count'
+    count_attr = '_article_count'
+    count_relation = 'article'
+    counts_cache_key = CATEGORY_ARTICLE_COUNTS_KEY
+    
+    def get_changelist(self, request, **kwargs):
+        return CachedCountChangeList
     
     def get_article_count(self, obj):
-        return Article.objects.filter(category=obj).count()
+        return obj._article_count
     get_article_count.short_description = 'Total Articles'
+    get_article_count.admin_order_field = '_article_count'
 
 
 # ============================================================================
@@ -144,16 +274,22 @@ class MediaFileInline(admin.TabularInline):
     extra = 1
     fields = ['file_path', 'file_type', 'original_name', 'recovery_status']
     readonly_fields = ['uploaded_by', 'created_at']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('uploaded_by', 'article')
 
 
 @admin.register(Article)
 class ArticleAdmin(admin.ModelAdmin):
     list_display = ['id', 'title', 'status', 'user', 'category', 'show', 'created_at']
     list_filter = ['status', 'category', 'created_at']
+    list_select_related = ['user', 'category', 'show']
     search_fields = ['title', 'content', 'user__name']
     ordering = ['-created_at']
     readonly_fields = ['created_at', 'updated_at']
     raw_id_fields = ['show']
+    paginator = LargeTablePaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Basic Information', {
@@ -170,6 +306,19 @@ class ArticleAdmin(admin.ModelAdmin):
     
     inlines = [MediaFileInline]
     
+    def get_search_results(self, request, queryset, search_term):
+        # Title & content dicari lewat FULLTEXT index articles(title, content)
+        if not search_term:
+            return super().get_search_results(request, queryset, search_term)
+        matches = RawSQL(
+            "SELECT id FROM articles WHERE CONTAINS((title, content), %s)",
+            [_fulltext_prefix(search_term)]
+        )
+        queryset = queryset.filter(
+            Q(id__in=matches) | Q(user__name__icontains=search_term)
+        )
+        return queryset, False
+    
     def save_model(self, request, obj, form, change):
         if not change:  # If creating new
             obj.user = request.user
@@ -181,15 +330,43 @@ class MediaFileAdmin(admin.ModelAdmin):
     list_display = ['id', 'get_article_title', 'original_name', 'file_type', 
                    'recovery_status', 'uploaded_by', 'created_at']
     list_filter = ['recovery_status', 'file_type', 'created_at']
+    list_select_related = ['article', 'uploaded_by']
     search_fields = ['original_name', 'article__title']
     ordering = ['-created_at']
     readonly_fields = ['uploaded_by', 'created_at']
     raw_id_fields = ['article']
+    paginator = LargeTablePaginator
+    show_full_result_count = False
     
     def get_article_title(self, obj):
         return obj.article.title
     get_article_title.short_description = 'Article'
     
+    def get_search_results(self, request, queryset, search_term):
+        # original_name lewat trigram index media_files_trgm, article title
+        # lewat FULLTEXT index articles; term < 3 huruf pakai LIKE biasa
+        term = search_term.strip().lower()
+        if len(term) < 3:
+            return super().get_search_results(request, queryset, search_term)
+        
+        trigrams = sorted({term[i:i + 3] for i in range(len(term) - 2)})
+        candidates = RawSQL(
+            "SELECT media_file_id FROM media_files_trgm "
+            "WHERE trgm IN (%s) " % ', '.join(['%s'] * len(trigrams)) +
+            "GROUP BY media_file_id HAVING COUNT(DISTINCT trgm) = %s",
+            trigrams + [len(trigrams)]
+        )
+        article_matches = RawSQL(
+            "SELECT id FROM articles WHERE CONTAINS(title, %s)",
+            [_fulltext_prefix(search_term)]
+        )
+        queryset = queryset.filter(
+            # Trigram hanya menyaring kandidat; icontains memastikan urutannya
+            Q(id__in=candidates, original_name__icontains=term) |
+            Q(article_id__in=article_matches)
+        )
+        return queryset, False
+    
     def save_model(self, request, obj, form, change):
         if not change:
             obj.uploaded_by = request.user
@@ -1,5 +1,9 @@
 from django.apps import AppConfig
 
 
-class AppConfig(AppConfig):
-    name = 'app'
+class ApiConfig(AppConfig):
+    name = 'api'
+    
+    def ready(self):
+        # Register signal handlers (cache invalidation)
+        from . import signals  # noqa: F401
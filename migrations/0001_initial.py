@@ -0,0 +1,212 @@
+# Generated by Django 5.2.18 on 2026-10-15 04:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('email', models.CharField(max_length=255, unique=True)),
+                ('password', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('is_staff', models.BooleanField(default=False)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'db_table': 'users',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Article',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=500)),
+                ('content', models.TextField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('published', 'Published'), ('archived', 'Archived')], default='draft', max_length=50)),
+                ('tconst', models.CharField(blank=True, max_length=15, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+            ],
+            options={
+                'db_table': 'articles',
+                'ordering': ['-created_at'],
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('slug', models.CharField(max_length=255, unique=True)),
+            ],
+            options={
+                'verbose_name_plural': 'categories',
+                'db_table': 'categories',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ListGenre',
+            fields=[
+                ('genre_id', models.AutoField(primary_key=True, serialize=False)),
+                ('genre_name', models.CharField(max_length=100)),
+            ],
+            options={
+                'db_table': 'list_genre',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='MasterShows',
+            fields=[
+                ('show_id', models.AutoField(db_column='Show_ID', primary_key=True, serialize=False)),
+                ('title', models.TextField(db_column='Title')),
+                ('release_year', models.IntegerField(db_column='ReleaseYear', null=True)),
+                ('first_source_table', models.CharField(db_column='First_Source_Table', max_length=20, null=True)),
+                ('first_source_id', models.CharField(db_column='First_Source_ID', max_length=20, null=True)),
+            ],
+            options={
+                'db_table': 'Master_Shows',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='MediaFile',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('file_path', models.CharField(max_length=1000)),
+                ('file_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('original_name', models.CharField(max_length=500)),
+                ('recovery_status', models.CharField(choices=[('Found', 'Found'), ('Partially_Found', 'Partially Found'), ('Fully_Lost', 'Fully Lost')], max_length=50)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'media_files',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Role',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('description', models.CharField(blank=True, max_length=255, null=True)),
+            ],
+            options={
+                'db_table': 'roles',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ShowGenreMapping',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+            options={
+                'db_table': 'Show_Genre_Mapping',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Shows',
+            fields=[
+                ('show_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255, null=True)),
+                ('number_of_seasons', models.IntegerField(null=True)),
+                ('number_of_episodes', models.IntegerField(null=True)),
+                ('overview', models.TextField(null=True)),
+                ('adult', models.BooleanField(null=True)),
+                ('in_production', models.BooleanField(null=True)),
+                ('original_name', models.CharField(max_length=255, null=True)),
+                ('popularity', models.FloatField(null=True)),
+                ('tagline', models.CharField(max_length=255, null=True)),
+                ('eposide_run_time', models.IntegerField(null=True)),
+                ('type_id', models.IntegerField(null=True)),
+                ('status_id', models.IntegerField(null=True)),
+            ],
+            options={
+                'db_table': 'shows',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ShowVotes',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vote_count', models.IntegerField(null=True)),
+                ('vote_average', models.FloatField(null=True)),
+            ],
+            options={
+                'db_table': 'show_votes',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TitleBasics',
+            fields=[
+                ('tconst', models.CharField(max_length=15, primary_key=True, serialize=False)),
+                ('title_type', models.TextField(db_column='titleType', null=True)),
+                ('primary_title', models.TextField(db_column='primaryTitle', null=True)),
+                ('original_title', models.TextField(db_column='originalTitle', null=True)),
+                ('is_adult', models.TextField(db_column='isAdult', null=True)),
+                ('start_year', models.IntegerField(db_column='startYear', null=True)),
+                ('end_year', models.IntegerField(db_column='endYear', null=True)),
+                ('runtime_minutes', models.IntegerField(db_column='runtimeMinutes', null=True)),
+            ],
+            options={
+                'db_table': 'title_basics',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='MediaPopularity',
+            fields=[
+                ('id', models.OneToOneField(db_column='ID', on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='api.mastershows')),
+                ('search_count', models.IntegerField(db_column='SearchCount', default=0)),
+            ],
+            options={
+                'db_table': 'MediaPopularity',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='MediaStatusLog',
+            fields=[
+                ('show', models.OneToOneField(db_column='Show_ID', on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='api.mastershows')),
+                ('recovery_status', models.CharField(choices=[('Founded', 'Founded'), ('Fully Lost', 'Fully Lost'), ('Partial Found', 'Partial Found')], max_length=50)),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'Media_StatusLog',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TitleRatings',
+            fields=[
+                ('tconst', models.OneToOneField(db_column='tconst', on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='api.titlebasics')),
+                ('average_rating', models.TextField(db_column='averageRating', null=True)),
+                ('num_votes', models.TextField(db_column='numVotes', null=True)),
+            ],
+            options={
+                'db_table': 'title_ratings',
+                'managed': False,
+            },
+        ),
+    ]
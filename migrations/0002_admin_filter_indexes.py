@@ -0,0 +1,50 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Index untuk kolom filter & ordering admin (tabel managed=False)"""
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE NONCLUSTERED INDEX IX_articles_status_created
+                ON articles(status, created_at DESC)
+                INCLUDE (title, user_id, category_id, show_id);
+            """,
+            reverse_sql="DROP INDEX IX_articles_status_created ON articles;",
+        ),
+        # Title bertipe NVARCHAR(MAX), jadi hanya bisa masuk INCLUDE, bukan key
+        migrations.RunSQL(
+            sql="""
+                CREATE NONCLUSTERED INDEX IX_master_shows_year
+                ON Master_Shows(ReleaseYear DESC)
+                INCLUDE (Title, First_Source_Table);
+            """,
+            reverse_sql="DROP INDEX IX_master_shows_year ON Master_Shows;",
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE NONCLUSTERED INDEX IX_master_shows_source
+                ON Master_Shows(First_Source_Table);
+            """,
+            reverse_sql="DROP INDEX IX_master_shows_source ON Master_Shows;",
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE NONCLUSTERED INDEX IX_media_files_status_created
+                ON media_files(recovery_status, created_at DESC);
+            """,
+            reverse_sql="DROP INDEX IX_media_files_status_created ON media_files;",
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE NONCLUSTERED INDEX IX_media_statuslog_status
+                ON Media_StatusLog(recovery_status);
+            """,
+            reverse_sql="DROP INDEX IX_media_statuslog_status ON Media_StatusLog;",
+        ),
+    ]
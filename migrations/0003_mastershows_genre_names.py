@@ -0,0 +1,83 @@
+from django.db import migrations, models
+
+
+GENRE_NAMES_SQL = """
+    SELECT LEFT(STRING_AGG(CAST(lg.genre_name AS NVARCHAR(MAX)), ',')
+                WITHIN GROUP (ORDER BY lg.genre_name), 500)
+    FROM Show_Genre_Mapping sgm
+    JOIN list_genre lg ON lg.genre_id = sgm.genre_id
+    WHERE sgm.Show_ID = ms.Show_ID
+"""
+
+
+class Migration(migrations.Migration):
+    """Denormalisasi nama genre ke Master_Shows.genre_names (dijaga trigger)"""
+
+    dependencies = [
+        ('api', '0002_admin_filter_indexes'),
+    ]
+
+    operations = [
+        # Model managed=False: AddField hanya mengubah state, kolom dibuat RunSQL
+        migrations.AddField(
+            model_name='mastershows',
+            name='genre_names',
+            field=models.CharField(max_length=500, null=True, blank=True, db_column='genre_names'),
+        ),
+        migrations.RunSQL(
+            sql="ALTER TABLE Master_Shows ADD genre_names NVARCHAR(500) NULL;",
+            reverse_sql="ALTER TABLE Master_Shows DROP COLUMN genre_names;",
+        ),
+        migrations.RunSQL(
+            sql=f"UPDATE ms SET genre_names = ({GENRE_NAMES_SQL}) FROM Master_Shows ms;",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        # CREATE TRIGGER harus jadi statement pertama dalam batch-nya sendiri
+        migrations.RunSQL(
+            sql=f"""
+                CREATE TRIGGER trg_sgm_genre_names
+                ON Show_Genre_Mapping
+                AFTER INSERT, UPDATE, DELETE
+                AS
+                BEGIN
+                    SET NOCOUNT ON;
+                    UPDATE ms SET genre_names = ({GENRE_NAMES_SQL})
+                    FROM Master_Shows ms
+                    WHERE ms.Show_ID IN (
+                        SELECT Show_ID FROM inserted
+                        UNION
+                        SELECT Show_ID FROM deleted
+                    );
+                END
+            """,
+            reverse_sql="DROP TRIGGER trg_sgm_genre_names;",
+        ),
+        # Rename genre (mis. lewat ListGenreAdmin) juga mengubah genre_names
+        # semua show yang memakai genre itu
+        migrations.RunSQL(
+            sql=f"""
+                CREATE TRIGGER trg_list_genre_genre_names
+                ON list_genre
+                AFTER UPDATE
+                AS
+                BEGIN
+                    SET NOCOUNT ON;
+                    UPDATE ms SET genre_names = ({GENRE_NAMES_SQL})
+                    FROM Master_Shows ms
+                    WHERE ms.Show_ID IN (
+                        SELECT sgm.Show_ID
+                        FROM Show_Genre_Mapping sgm
+                        JOIN inserted i ON i.genre_id = sgm.genre_id
+                        JOIN deleted d ON d.genre_id = i.genre_id
+                        -- BIN2: rename yang hanya mengubah huruf besar/kecil tetap terdeteksi
+                        WHERE NOT EXISTS (
+                            SELECT i.genre_name COLLATE Latin1_General_BIN2
+                            INTERSECT
+                            SELECT d.genre_name COLLATE Latin1_General_BIN2
+                        )
+                    );
+                END
+            """,
+            reverse_sql="DROP TRIGGER trg_list_genre_genre_names;",
+        ),
+    ]
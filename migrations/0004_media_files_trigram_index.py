@@ -0,0 +1,77 @@
+from django.db import migrations
+
+
+# Semua trigram (lowercase) dari original_name baris di tabel sumber `src`
+TRIGRAMS_SQL = """
+    SELECT DISTINCT src.id, SUBSTRING(LOWER(src.original_name), n.n, 3)
+    FROM {source} src
+    CROSS APPLY (
+        SELECT TOP (CASE WHEN LEN(src.original_name) > 2
+                         THEN LEN(src.original_name) - 2 ELSE 0 END)
+            ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) AS n
+        FROM sys.all_objects
+    ) n
+"""
+
+# Baris `inserted` yang original_name-nya berubah (diisi trigger ke @changed)
+CHANGED_ROWS_SQL = """(
+    SELECT i.id, i.original_name
+    FROM inserted i
+    JOIN @changed c ON c.id = i.id
+)"""
+
+
+class Migration(migrations.Migration):
+    """Trigram index untuk substring search media_files.original_name"""
+
+    dependencies = [
+        ('api', '0003_mastershows_genre_names'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE TABLE media_files_trgm (
+                    media_file_id INT NOT NULL,
+                    trgm NCHAR(3) NOT NULL,
+                    CONSTRAINT PK_media_files_trgm PRIMARY KEY (trgm, media_file_id)
+                );
+            """,
+            reverse_sql="DROP TABLE media_files_trgm;",
+        ),
+        migrations.RunSQL(
+            sql="INSERT INTO media_files_trgm (media_file_id, trgm) "
+                + TRIGRAMS_SQL.format(source='media_files') + ";",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        # CREATE TRIGGER harus jadi statement pertama dalam batch-nya sendiri
+        migrations.RunSQL(
+            sql=f"""
+                CREATE TRIGGER trg_media_files_trgm
+                ON media_files
+                AFTER INSERT, UPDATE, DELETE
+                AS
+                BEGIN
+                    SET NOCOUNT ON;
+                    -- Model.save() menulis semua kolom, jadi UPDATE(original_name)
+                    -- selalu true. Bandingkan nilai lama dan baru per baris
+                    -- (NULL-safe lewat INTERSECT); INSERT dan DELETE selalu masuk.
+                    DECLARE @changed TABLE (id INT PRIMARY KEY);
+                    INSERT INTO @changed (id)
+                    SELECT COALESCE(i.id, d.id)
+                    FROM inserted i
+                    FULL OUTER JOIN deleted d ON d.id = i.id
+                    WHERE i.id IS NULL
+                        OR d.id IS NULL
+                        OR NOT EXISTS (SELECT i.original_name INTERSECT SELECT d.original_name);
+                    IF NOT EXISTS (SELECT 1 FROM @changed)
+                        RETURN;
+                    DELETE t FROM media_files_trgm t
+                    WHERE t.media_file_id IN (SELECT id FROM @changed);
+                    INSERT INTO media_files_trgm (media_file_id, trgm)
+                    {TRIGRAMS_SQL.format(source=CHANGED_ROWS_SQL)};
+                END
+            """,
+            reverse_sql="DROP TRIGGER trg_media_files_trgm;",
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Index list_genre.genre_name untuk lookup genre by name"""
+
+    dependencies = [
+        ('api', '0004_media_files_trigram_index'),
+    ]
+
+    operations = [
+        # Model managed=False: AlterField hanya mengubah state, index dibuat RunSQL
+        migrations.AlterField(
+            model_name='listgenre',
+            name='genre_name',
+            field=models.CharField(max_length=100, db_index=True),
+        ),
+        migrations.RunSQL(
+            sql="CREATE NONCLUSTERED INDEX IX_list_genre_name ON list_genre(genre_name);",
+            reverse_sql="DROP INDEX IX_list_genre_name ON list_genre;",
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Index (status, category_id, created_at DESC) untuk feed artikel per kategori"""
+
+    dependencies = [
+        ('api', '0005_list_genre_name_index'),
+    ]
+
+    operations = [
+        # Model managed=False: AddIndex hanya mengubah state, index dibuat RunSQL
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['status', 'category', '-created_at'],
+                               name='IX_articles_status_cat_created'),
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE NONCLUSTERED INDEX IX_articles_status_cat_created
+                ON articles(status, category_id, created_at DESC);
+            """,
+            reverse_sql="DROP INDEX IX_articles_status_cat_created ON articles;",
+        ),
+    ]
@@ -0,0 +1,70 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Denormalisasi MediaPopularity.SearchCount ke Master_Shows.search_count"""
+
+    dependencies = [
+        ('api', '0006_article_status_category_index'),
+    ]
+
+    operations = [
+        # Model managed=False: AddField/AddIndex hanya mengubah state,
+        # kolom, index, dan trigger dibuat RunSQL
+        migrations.AddField(
+            model_name='mastershows',
+            name='search_count',
+            field=models.BigIntegerField(default=0, db_column='search_count'),
+        ),
+        migrations.AddIndex(
+            model_name='mastershows',
+            index=models.Index(fields=['-search_count'], name='IX_master_shows_search_count'),
+        ),
+        migrations.RunSQL(
+            sql="""
+                ALTER TABLE Master_Shows ADD search_count BIGINT NOT NULL
+                    CONSTRAINT DF_Master_Shows_search_count DEFAULT 0;
+            """,
+            reverse_sql="""
+                ALTER TABLE Master_Shows DROP CONSTRAINT DF_Master_Shows_search_count;
+                ALTER TABLE Master_Shows DROP COLUMN search_count;
+            """,
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE ms SET search_count = mp.SearchCount
+                FROM Master_Shows ms
+                JOIN MediaPopularity mp ON mp.ID = ms.Show_ID;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE NONCLUSTERED INDEX IX_master_shows_search_count
+                ON Master_Shows(search_count DESC)
+                INCLUDE (Title, ReleaseYear);
+            """,
+            reverse_sql="DROP INDEX IX_master_shows_search_count ON Master_Shows;",
+        ),
+        # CREATE TRIGGER harus jadi statement pertama dalam batch-nya sendiri
+        migrations.RunSQL(
+            sql="""
+                CREATE TRIGGER trg_mp_search_count
+                ON MediaPopularity
+                AFTER INSERT, UPDATE, DELETE
+                AS
+                BEGIN
+                    SET NOCOUNT ON;
+                    UPDATE ms SET search_count = ISNULL(mp.SearchCount, 0)
+                    FROM Master_Shows ms
+                    LEFT JOIN MediaPopularity mp ON mp.ID = ms.Show_ID
+                    WHERE ms.Show_ID IN (
+                        SELECT ID FROM inserted
+                        UNION
+                        SELECT ID FROM deleted
+                    );
+                END
+            """,
+            reverse_sql="DROP TRIGGER trg_mp_search_count;",
+        ),
+    ]
@@ -0,0 +1,65 @@
+from django.db import migrations
+
+
+FULLTEXT_CATALOG = 'ftc_lost_media'
+
+
+def create_fulltext_index(table, columns):
+    """
+    CREATE FULLTEXT INDEX dengan KEY INDEX = primary key tabel. Nama PK tidak
+    diketahui (tabel dibuat di luar migrasi), jadi dicari dari sys.indexes.
+    Dilewati kalau index sudah ada (mis. sudah dibuat manual).
+    """
+    return f"""
+        IF NOT EXISTS (SELECT 1 FROM sys.fulltext_indexes WHERE object_id = OBJECT_ID('{table}'))
+        BEGIN
+            DECLARE @key_index SYSNAME = (
+                SELECT name FROM sys.indexes
+                WHERE object_id = OBJECT_ID('{table}') AND is_primary_key = 1
+            );
+            DECLARE @sql NVARCHAR(MAX) =
+                N'CREATE FULLTEXT INDEX ON {table} ({columns}) KEY INDEX '
+                + QUOTENAME(@key_index)
+                + N' ON {FULLTEXT_CATALOG} WITH CHANGE_TRACKING AUTO;';
+            EXEC sp_executesql @sql;
+        END
+    """
+
+
+def drop_fulltext_index(table):
+    return f"""
+        IF EXISTS (SELECT 1 FROM sys.fulltext_indexes WHERE object_id = OBJECT_ID('{table}'))
+            DROP FULLTEXT INDEX ON {table};
+    """
+
+
+class Migration(migrations.Migration):
+    """Full-text catalog & index untuk CONTAINS() di search admin"""
+
+    # DDL FULLTEXT tidak boleh berjalan di dalam transaksi
+    atomic = False
+
+    dependencies = [
+        ('api', '0007_mastershows_search_count'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=f"""
+                IF NOT EXISTS (SELECT 1 FROM sys.fulltext_catalogs WHERE name = '{FULLTEXT_CATALOG}')
+                    CREATE FULLTEXT CATALOG {FULLTEXT_CATALOG};
+            """,
+            reverse_sql=f"""
+                IF EXISTS (SELECT 1 FROM sys.fulltext_catalogs WHERE name = '{FULLTEXT_CATALOG}')
+                    DROP FULLTEXT CATALOG {FULLTEXT_CATALOG};
+            """,
+        ),
+        migrations.RunSQL(
+            sql=create_fulltext_index('articles', 'title, content'),
+            reverse_sql=drop_fulltext_index('articles'),
+        ),
+        migrations.RunSQL(
+            sql=create_fulltext_index('Master_Shows', 'Title'),
+            reverse_sql=drop_fulltext_index('Master_Shows'),
+        ),
+    ]
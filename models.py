@@ -1,4 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
 from django.db import models
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 
 # ============================================================================
@@ -19,9 +23,25 @@ class Role(models.Model):
         return self.name
 
 
+ROLE_NAMES_CACHE_KEY = 'role_names'
+ROLE_NAMES_TIMEOUT = 300  # detik
+
+
+def role_names():
+    """
+    Mapping {role_id: name} di shared cache (tabel roles hampir tidak pernah
+    berubah). Dihapus oleh signal saat Role disimpan/dihapus.
+    """
+    names = cache.get(ROLE_NAMES_CACHE_KEY)
+    if names is None:
+        names = dict(Role.objects.values_list('id', 'name'))
+        cache.set(ROLE_NAMES_CACHE_KEY, names, ROLE_NAMES_TIMEOUT)
+    return names
+
+
 class UserManager(BaseUserManager):
     """Custom user manager"""
-    def create_user(self, email, name, password=None, role_id=3):
+    def create_user(self, email, name, password=None, role_id=3, password_hash=None):
         if not email:
             raise ValueError('Users must have an email address')
         user = self.model(
@@ -29,10 +49,50 @@ class UserManager(BaseUserManager):
             name=name,
             role_id=role_id
         )
-        user.set_password(password)
+        if password_hash:
+            # Hash sudah jadi (mis. dari import), tidak perlu hashing ulang
+            user.password = password_hash
+        elif password:
+            user.set_password(password)
+        else:
+            user.set_unusable_password()
         user.save(using=self._db)
         return user
     
+    def bulk_create_users(self, users, batch_size=500):
+        """
+        Buat banyak user sekaligus. `users` berisi dict dengan key
+        email, name, dan opsional password, password_hash, role_id.
+        """
+        users = list(users)
+        for data in users:
+            if not data.get('email'):
+                raise ValueError('Users must have an email address')
+        
+        # PBKDF2 (hashlib) melepas GIL, jadi hashing bisa paralel di thread
+        plain = [
+            data['password'] for data in users
+            if not data.get('password_hash') and data.get('password')
+        ]
+        with ThreadPoolExecutor() as executor:
+            hashes = iter(list(executor.map(make_password, plain)))
+        
+        objs = []
+        for data in users:
+            if data.get('password_hash'):
+                password = data['password_hash']
+            elif data.get('password'):
+                password = next(hashes)
+            else:
+                password = make_password(None)
+            objs.append(self.model(
+                email=self.normalize_email(data['email']),
+                name=data['name'],
+                role_id=data.get('role_id', 3),
+                password=password
+            ))
+        return self.bulk_create(objs, batch_size=batch_size)
+    
     def create_superuser(self, email, name, password):
         user = self.create_user(email, name, password, role_id=1)
         user.is_staff = True
@@ -65,6 +125,15 @@ class User(AbstractBaseUser, PermissionsMixin):
     
     def __str__(self):
         return self.email
+    
+    @property
+    def role_name(self):
+        """Nama role dari cache role_names(), tanpa query per request"""
+        name = role_names().get(self.role_id)
+        if name is None:
+            # Role baru yang belum masuk cache
+            name = self.role.name
+        return name
 
 
 # ============================================================================
@@ -78,19 +147,44 @@ class MasterShows(models.Model):
     release_year = models.IntegerField(null=True, db_column='ReleaseYear')
     first_source_table = models.CharField(max_length=20, null=True, db_column='First_Source_Table')
     first_source_id = models.CharField(max_length=20, null=True, db_column='First_Source_ID')
+    # Denormalisasi dari Show_Genre_Mapping, diisi trigger trg_sgm_genre_names
+    genre_names = models.CharField(max_length=500, null=True, blank=True, db_column='genre_names')
+    # Denormalisasi dari MediaPopularity.SearchCount, diisi trigger trg_mp_search_count
+    search_count = models.BigIntegerField(default=0, db_column='search_count')
     
     class Meta:
         db_table = 'Master_Shows'
         managed = False
+        indexes = [
+            models.Index(fields=['-search_count'], name='IX_master_shows_search_count'),
+        ]
+    
+    # Kolom yang ditulis trigger; tidak pernah ikut UPDATE dari ORM
+    TRIGGER_FIELDS = ('genre_names', 'search_count')
     
     def __str__(self):
         return f"{self.title} ({self.release_year})"
+    
+    def save(self, *args, **kwargs):
+        # Nilai yang dimuat bisa sudah basi (mis. change form admin); jangan
+        # timpa tulisan trigger yang terjadi setelahnya
+        if not self._state.adding:
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                update_fields = [
+                    field.name for field in self._meta.concrete_fields
+                    if not field.primary_key
+                ]
+            kwargs['update_fields'] = [
+                name for name in update_fields if name not in self.TRIGGER_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
 
 class ListGenre(models.Model):
     """Model untuk list_genre"""
     genre_id = models.AutoField(primary_key=True)
-    genre_name = models.CharField(max_length=100)
+    genre_name = models.CharField(max_length=100, db_index=True)
     
     class Meta:
         db_table = 'list_genre'
@@ -189,6 +283,10 @@ class Article(models.Model):
         db_table = 'articles'
         managed = False
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'category', '-created_at'],
+                         name='IX_articles_status_cat_created'),
+        ]
     
     def __str__(self):
         return self.title
@@ -0,0 +1,23 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer berbasis orjson (jauh lebih cepat dari stdlib json)"""
+    
+    # Tipe yang tidak didukung orjson (Decimal, lazy string, dll)
+    # diserahkan ke encoder bawaan DRF
+    _fallback = JSONEncoder().default
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        
+        # DRF bisa menghasilkan key int (mis. error ListField {'tags': {1: [...]}});
+        # stdlib json mengubahnya jadi string, orjson perlu OPT_NON_STR_KEYS
+        option = orjson.OPT_NON_STR_KEYS
+        # Browsable API (DEBUG) meminta indent lewat accepted_media_type
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=self._fallback, option=option)
@@ -12,7 +12,8 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = 'your-secret-key-here-change-in-production'
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# Aktifkan hanya dengan DJANGO_DEBUG=1 (development)
+DEBUG = os.environ.get('DJANGO_DEBUG') == '1'
 
 ALLOWED_HOSTS = ['*']  # Change in production
 
@@ -77,9 +78,18 @@ DATABASES = {
         'PASSWORD': 'your_password',  # Ganti dengan password
         'HOST': 'localhost',  # Atau IP server SQL Server
         'PORT': '1433',
+        # Pakai ulang koneksi antar request (hemat handshake TLS + login)
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+        # Jangan bungkus tiap request dalam transaksi; view yang menulis
+        # beberapa tabel pakai transaction.atomic() sendiri
+        'ATOMIC_REQUESTS': False,
         'OPTIONS': {
-            'driver': 'ODBC Driver 17 for SQL Server',  # Atau driver yang terinstal
-            'extra_params': 'TrustServerCertificate=yes',
+            'driver': 'ODBC Driver 18 for SQL Server',  # Atau driver yang terinstal
+            'extra_params': (
+                'TrustServerCertificate=yes;Encrypt=yes;'
+                'MARS_Connection=yes;Packet Size=32767'
+            ),
         },
     }
 }
@@ -94,6 +104,25 @@ DATABASES = {
 #     }
 # }
 
+# ============================================================================
+# CACHE CONFIGURATION
+# ============================================================================
+# Pakai Redis kalau REDIS_URL di-set supaya cache (dan invalidasinya) dipakai
+# bersama oleh semua worker; fallback ke local memory untuk development
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # ============================================================================
 # CUSTOM USER MODEL
 # ============================================================================
@@ -126,7 +155,6 @@ AUTH_PASSWORD_VALIDATORS = [
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework_simplejwt.authentication.JWTAuthentication',
-        'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
@@ -139,13 +167,21 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
+        'api.renderers.ORJSONRenderer',
     ],
     'DATETIME_FORMAT': '%Y-%m-%d %H:%M:%S',
     'DATE_FORMAT': '%Y-%m-%d',
 }
 
+# Browsable API (dan login session-nya) hanya untuk development
+if DEBUG:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].append(
+        'rest_framework.renderers.BrowsableAPIRenderer'
+    )
+    REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES'].append(
+        'rest_framework.authentication.SessionAuthentication'
+    )
+
 # ============================================================================
 # JWT CONFIGURATION
 # ============================================================================
@@ -250,15 +286,22 @@ LOGGING = {
             'filename': 'debug.log',
             'formatter': 'verbose',
         },
+        # Request thread hanya enqueue record; tulis ke console/file
+        # dilakukan QueueListener di background thread (Python 3.12+)
+        'queue': {
+            'class': 'logging.handlers.QueueHandler',
+            'handlers': ['console', 'file'],
+            'respect_handler_level': True,
+        },
     },
     'root': {
-        'handlers': ['console', 'file'],
+        'handlers': ['queue'],
         'level': 'INFO',
     },
     'loggers': {
         'django.db.backends': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            'level': 'DEBUG' if DEBUG else 'WARNING',
             'propagate': False,
         },
     },
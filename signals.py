@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import (
+    ROLE_NAMES_CACHE_KEY, Role, User, MasterShows, ListGenre, ShowGenreMapping,
+    MediaStatusLog, MediaPopularity, Article, MediaFile
+)
+
+# ============================================================================
+# ROLE LOOKUP CACHE INVALIDATION
+# ============================================================================
+
+@receiver([post_save, post_delete], sender=Role)
+def invalidate_role_names(sender, **kwargs):
+    """Hapus cache role_names() supaya perubahan role langsung terbaca"""
+    cache.delete(ROLE_NAMES_CACHE_KEY)
+
+
+# ============================================================================
+# DASHBOARD CACHE INVALIDATION
+# ============================================================================
+
+DASHBOARD_STATS_CACHE_KEY = 'dashboard_stats'
+DASHBOARD_STATS_TIMEOUT = 60  # detik
+
+
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=MasterShows)
+@receiver([post_save, post_delete], sender=MediaStatusLog)
+@receiver([post_save, post_delete], sender=MediaPopularity)
+@receiver([post_save, post_delete], sender=Article)
+@receiver([post_save, post_delete], sender=MediaFile)
+def invalidate_dashboard_stats(sender, **kwargs):
+    """Hapus cache dashboard_stats setiap ada perubahan data yang ditampilkan"""
+    # Update last_login tiap login tidak mengubah angka di dashboard
+    if kwargs.get('update_fields') == frozenset(['last_login']):
+        return
+    cache.delete(DASHBOARD_STATS_CACHE_KEY)
+
+
+# ============================================================================
+# ADMIN COUNT CACHE INVALIDATION
+# ============================================================================
+
+CATEGORY_ARTICLE_COUNTS_KEY = 'admin:category_article_counts'
+GENRE_SHOW_COUNTS_KEY = 'admin:genre_show_counts'
+ADMIN_COUNTS_TIMEOUT = 300  # detik
+
+
+@receiver([post_save, post_delete], sender=Article)
+def invalidate_category_article_counts(sender, **kwargs):
+    """Hapus cache jumlah artikel per kategori (CategoryAdmin)"""
+    cache.delete(CATEGORY_ARTICLE_COUNTS_KEY)
+
+
+@receiver([post_save, post_delete], sender=ShowGenreMapping)
+def invalidate_genre_show_counts(sender, **kwargs):
+    """Hapus cache jumlah show per genre (ListGenreAdmin)"""
+    cache.delete(GENRE_SHOW_COUNTS_KEY)
+
+
+# ============================================================================
+# GENRE LOOKUP CACHE INVALIDATION
+# ============================================================================
+
+GENRE_IDS_CACHE_KEY = 'genre_ids_by_name'
+GENRE_IDS_TIMEOUT = 600  # detik
+
+
+@receiver([post_save, post_delete], sender=ListGenre)
+def invalidate_genre_ids(sender, **kwargs):
+    """Hapus cache mapping nama genre -> genre_id"""
+    cache.delete(GENRE_IDS_CACHE_KEY)
@@ -1,3 +1,155 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib import admin
+from django.db import models
+from django.test import RequestFactory, SimpleTestCase
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from .admin import CachedCountChangeList, CategoryAdmin, ListGenreAdmin
+from .models import Article, Category, ListGenre, MasterShows, MediaFile, Role, User
+from .serializers import ArticleListSerializer, MasterShowsListSerializer
+from .views import ArticleViewSet, MasterShowsViewSet, StandardResultsSetPagination
+
+
+class FakeCursor:
+    """Cursor DB-API minimal: description + fetchmany atas list baris"""
+    
+    def __init__(self, rows, columns=('ID', 'Title')):
+        self.description = [(name,) for name in columns]
+        self._rows = list(rows)
+    
+    def fetchmany(self, size):
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+
+class PaginateCursorTests(SimpleTestCase):
+    factory = APIRequestFactory()
+    
+    def paginate(self, total, **params):
+        request = Request(self.factory.get('/api/search/', params))
+        paginator = StandardResultsSetPagination()
+        cursor = FakeCursor([(i, 'Show %d' % i) for i in range(1, total + 1)])
+        return paginator, paginator.paginate_cursor(cursor, request, batch_size=7)
+    
+    def test_page_in_range(self):
+        paginator, results = self.paginate(45, page=2)
+        self.assertEqual(paginator.page.paginator.count, 45)
+        self.assertEqual(paginator.page.number, 2)
+        self.assertEqual([row['ID'] for row in results], list(range(21, 41)))
+        self.assertEqual(results[0], {'ID': 21, 'Title': 'Show 21'})
+    
+    def test_last_page(self):
+        paginator, results = self.paginate(45, page='last')
+        self.assertEqual(paginator.page.number, 3)
+        self.assertEqual([row['ID'] for row in results], list(range(41, 46)))
+    
+    def test_page_past_the_end(self):
+        with self.assertRaises(NotFound):
+            self.paginate(45, page=4)
+    
+    def test_page_not_an_integer(self):
+        with self.assertRaises(NotFound):
+            self.paginate(45, page='abc')
+    
+    def test_empty_results(self):
+        paginator, results = self.paginate(0)
+        self.assertEqual(paginator.page.paginator.count, 0)
+        self.assertEqual(results, [])
+        with self.assertRaises(NotFound):
+            self.paginate(0, page=3)
+
+
+@mock.patch.object(CachedCountChangeList, 'get_results')
+class CachedCountChangeListTests(SimpleTestCase):
+    factory = RequestFactory()
+    
+    def changelist(self, admin_class, model, url):
+        request = self.factory.get(url)
+        request.user = User(is_active=True, is_staff=True, is_superuser=True)
+        return admin_class(model, admin.site).get_changelist_instance(request)
+    
+    def test_sort_by_article_count(self, get_results):
+        # Index 4: action_checkbox + id, name, slug, get_article_count
+        for o, ordering in (('4', '_article_count'), ('-4', '-_article_count')):
+            cl = self.changelist(CategoryAdmin, Category, '/admin/api/category/?o=%s' % o)
+            self.assertIn('_article_count', cl.queryset.query.annotations)
+            self.assertEqual(cl.queryset.query.order_by[0], ordering)
+    
+    def test_sort_by_other_column_skips_group_by(self, get_results):
+        cl = self.changelist(CategoryAdmin, Category, '/admin/api/category/?o=3')
+        self.assertNotIn('_article_count', cl.queryset.query.annotations)
+        cl = self.changelist(CategoryAdmin, Category, '/admin/api/category/')
+        self.assertNotIn('_article_count', cl.queryset.query.annotations)
+    
+    def test_sort_by_show_count(self, get_results):
+        cl = self.changelist(ListGenreAdmin, ListGenre, '/admin/api/listgenre/?o=-3')
+        self.assertIn('_show_count', cl.queryset.query.annotations)
+        self.assertEqual(cl.queryset.query.order_by[0], '-_show_count')
+
+
+@mock.patch.object(models.Model, 'save')
+class MasterShowsSaveTests(SimpleTestCase):
+    
+    def loaded_show(self):
+        show = MasterShows(show_id=1, title='Show', genre_names='Drama', search_count=5)
+        show._state.adding = False
+        return show
+    
+    def test_update_skips_trigger_fields(self, save):
+        self.loaded_show().save()
+        update_fields = save.call_args.kwargs['update_fields']
+        self.assertIn('title', update_fields)
+        self.assertNotIn('genre_names', update_fields)
+        self.assertNotIn('search_count', update_fields)
+    
+    def test_explicit_update_fields_drop_trigger_fields(self, save):
+        self.loaded_show().save(update_fields=['title', 'search_count'])
+        self.assertEqual(save.call_args.kwargs['update_fields'], ['title'])
+    
+    def test_insert_writes_all_fields(self, save):
+        MasterShows(title='Show').save()
+        self.assertNotIn('update_fields', save.call_args.kwargs)
+
+
+class ListSerializerDeferredFieldTests(SimpleTestCase):
+    """
+    List endpoint men-defer kolom besar. Serializer list yang membaca kolom
+    itu memicu satu query per baris, dan SimpleTestCase menolak query.
+    """
+    factory = APIRequestFactory()
+    
+    def deferred_fields(self, viewset_class):
+        request = Request(self.factory.get('/'))
+        view = viewset_class(action='list', request=request, format_kwarg=None)
+        names, defer = view.get_queryset().query.deferred_loading
+        self.assertTrue(defer)
+        return names
+    
+    def loaded(self, model, deferred, **values):
+        """Instance seperti hasil query dengan kolom `deferred` di-defer"""
+        names = [f.attname for f in model._meta.concrete_fields if f.name not in deferred]
+        return model.from_db('default', names, [values.get(name) for name in names])
+    
+    def test_article_list_serializer(self):
+        deferred = self.deferred_fields(ArticleViewSet)
+        self.assertEqual(deferred, {'content'})
+        article = self.loaded(
+            Article, deferred, id=1, title='Judul', status='published',
+            user_id=1, category_id=1, show_id=1
+        )
+        # Relasi yang di-select_related / prefetch_related oleh ArticleViewSet
+        article.user = User(id=1, name='Penulis', email='penulis@example.com',
+                            role=Role(id=3, name='Contributor'))
+        article.category = Category(id=1, name='Berita', slug='berita')
+        article.show = MasterShows(show_id=1, title='Show', release_year=1990)
+        article._prefetched_objects_cache = {'media_files': MediaFile.objects.none()}
+        ArticleListSerializer(article).data
+    
+    def test_master_shows_list_serializer(self):
+        deferred = self.deferred_fields(MasterShowsViewSet)
+        self.assertEqual(deferred, {'genre_names'})
+        show = self.loaded(MasterShows, deferred, show_id=1, title='Show', release_year=1990)
+        MasterShowsListSerializer(show).data
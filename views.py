@@ -1,10 +1,18 @@
+import csv
+
+from django.core.cache import cache
+from django.core.paginator import InvalidPage, Page, Paginator
 from django.db import connection
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny, IsAuthenticatedOrReadOnly
 from rest_framework.pagination import PageNumberPagination
-from django.db.models import Q, Count, Prefetch
+from django.db.models import Q, F, Count, Prefetch, Exists, OuterRef
 from django.shortcuts import get_object_or_404
 
 from .models import (
@@ -19,6 +27,10 @@ from .serializers import (
     MediaFileSerializer, SearchResultSerializer, TrendingMediaSerializer,
     GenreStatSerializer, StatusStatSerializer
 )
+from .signals import (
+    DASHBOARD_STATS_CACHE_KEY, DASHBOARD_STATS_TIMEOUT,
+    GENRE_IDS_CACHE_KEY, GENRE_IDS_TIMEOUT
+)
 
 
 # ============================================================================
@@ -29,6 +41,89 @@ class StandardResultsSetPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
+    
+    def paginate_cursor(self, cursor, request, batch_size=1000):
+        """
+        Paginate hasil raw query / stored procedure. Hanya baris di halaman
+        yang diminta yang dibuat objeknya; sisanya cukup dihitung.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        page_number = request.query_params.get(self.page_query_param) or 1
+        last_page = page_number in self.last_page_strings
+        try:
+            start = 0 if last_page else (int(page_number) - 1) * page_size
+        except ValueError:
+            # Bukan angka: langsung ditolak validate_number, cursor tidak perlu dibaca
+            start = None
+        
+        rows = []
+        count = 0
+        while start is not None:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            if last_page:
+                # Cukup simpan blok page_size terakhir; itulah halaman terakhir
+                rows.extend(batch)
+                count += len(batch)
+                del rows[:len(rows) - ((count - 1) % page_size + 1)]
+                continue
+            end = start + page_size
+            if count < end and count + len(batch) > start:
+                rows.extend(batch[max(start - count, 0):end - count])
+            count += len(batch)
+        
+        paginator = Paginator([], page_size)
+        paginator.count = count
+        if last_page:
+            page_number = paginator.num_pages
+        try:
+            page_number = paginator.validate_number(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            )
+            raise NotFound(msg)
+        
+        columns = [col[0] for col in cursor.description]
+        self.page = Page([dict(zip(columns, row)) for row in rows], page_number, paginator)
+        return list(self.page)
+
+
+# Endpoint agregat publik (AllowAny) di-cache per URL; angkanya berubah
+# dalam hitungan menit, jadi TTL pendek cukup
+STATS_CACHE_TIMEOUT = 60  # detik
+
+
+def _trending_shows(limit):
+    """Top `limit` show berdasarkan search count (denormalisasi di Master_Shows)"""
+    # Alias kolom sama dengan hasil raw SQL sebelumnya (Title, ReleaseYear, SearchCount)
+    return list(
+        MasterShows.objects.filter(search_count__gt=0).order_by('-search_count').values(
+            Title=F('title'),
+            ReleaseYear=F('release_year'),
+            SearchCount=F('search_count')
+        )[:limit]
+    )
+
+
+def _genre_id_by_name(genre_name):
+    """Resolve nama genre (case-insensitive) ke genre_id lewat cache"""
+    genre_ids = cache.get(GENRE_IDS_CACHE_KEY)
+    if genre_ids is None:
+        genre_ids = {
+            name.lower(): genre_id
+            for genre_id, name in ListGenre.objects.values_list('genre_id', 'genre_name')
+        }
+        cache.set(GENRE_IDS_CACHE_KEY, genre_ids, GENRE_IDS_TIMEOUT)
+    return genre_ids.get(genre_name.lower())
+
+
+class _Echo:
+    """Pseudo-buffer untuk csv.writer: writerow() langsung return barisnya"""
+    def write(self, value):
+        return value
 
 
 # ============================================================================
@@ -64,7 +159,7 @@ class UserViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         # User biasa hanya bisa lihat diri sendiri, admin bisa lihat semua
-        if self.request.user.role.name == 'Admin':
+        if self.request.user.role_name == 'Admin':
             return self.queryset
         return self.queryset.filter(id=self.request.user.id)
     
@@ -97,6 +192,11 @@ class MasterShowsViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         queryset = self.queryset
         
+        # genre_names (denormalisasi, NVARCHAR(500)) tidak dipakai
+        # MasterShowsListSerializer
+        if self.action == 'list':
+            queryset = queryset.defer('genre_names')
+        
         # Filter by year range
         year_from = self.request.query_params.get('year_from', None)
         year_to = self.request.query_params.get('year_to', None)
@@ -109,17 +209,23 @@ class MasterShowsViewSet(viewsets.ReadOnlyModelViewSet):
         # Filter by genre
         genre = self.request.query_params.get('genre', None)
         if genre:
+            genre_id = _genre_id_by_name(genre)
+            if genre_id is None:
+                return queryset.none()
+            # EXISTS tidak menduplikasi baris, jadi tidak perlu distinct()
             queryset = queryset.filter(
-                showgenremapping__genre__genre_name__icontains=genre
-            ).distinct()
+                Exists(ShowGenreMapping.objects.filter(
+                    show_id=OuterRef('show_id'), genre_id=genre_id
+                ))
+            )
         
         # Filter by status
         recovery_status = self.request.query_params.get('status', None)
         if recovery_status:
             if recovery_status.lower() == 'unknown':
-                # Shows without status log
-                queryset = queryset.exclude(
-                    show_id__in=MediaStatusLog.objects.values_list('show_id', flat=True)
+                # Shows without status log (NOT EXISTS anti-join)
+                queryset = queryset.filter(
+                    ~Exists(MediaStatusLog.objects.filter(show_id=OuterRef('show_id')))
                 )
             else:
                 queryset = queryset.filter(
@@ -128,43 +234,70 @@ class MasterShowsViewSet(viewsets.ReadOnlyModelViewSet):
         
         return queryset
     
+    @method_decorator(cache_page(STATS_CACHE_TIMEOUT, key_prefix='shows_trending'))
     @action(detail=False, methods=['get'])
     def trending(self, request):
         """Get top 10 trending lost media"""
-        with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT TOP 10
-                    ms.Title,
-                    ms.ReleaseYear,
-                    mp.SearchCount
-                FROM dbo.Master_Shows AS ms
-                JOIN dbo.MediaPopularity AS mp ON ms.Show_ID = mp.ID
-                ORDER BY mp.SearchCount DESC
-            """)
-            columns = [col[0] for col in cursor.description]
-            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-        
-        serializer = TrendingMediaSerializer(results, many=True)
+        serializer = TrendingMediaSerializer(_trending_shows(10), many=True)
         return Response(serializer.data)
     
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def export(self, request):
+        """Export shows (sesuai filter) sebagai CSV secara streaming"""
+        rows = self.filter_queryset(self.get_queryset()).values_list(
+            'show_id', 'title', 'release_year'
+        ).iterator(chunk_size=2000)
+        
+        writer = csv.writer(_Echo())
+        
+        def stream():
+            yield writer.writerow(['show_id', 'title', 'release_year'])
+            for row in rows:
+                yield writer.writerow(row)
+        
+        response = StreamingHttpResponse(stream(), content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="shows.csv"'
+        return response
+    
+    @method_decorator(cache_page(STATS_CACHE_TIMEOUT, key_prefix='shows_stats'))
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """Get statistics untuk dashboard"""
-        # Total shows
-        total_shows = MasterShows.objects.count()
+        # Total, status breakdown, dan top genre dalam satu round trip;
+        # kolom `kind` menandai asal tiap baris
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                WITH status_counts AS (
+                    SELECT recovery_status, COUNT(*) AS cnt
+                    FROM Media_StatusLog
+                    GROUP BY recovery_status
+                ),
+                genre_counts AS (
+                    SELECT TOP 10 lg.genre_name, COUNT(sgm.Show_ID) AS cnt
+                    FROM Show_Genre_Mapping sgm
+                    JOIN list_genre lg ON lg.genre_id = sgm.genre_id
+                    GROUP BY lg.genre_name
+                    ORDER BY cnt DESC
+                )
+                SELECT 'total' AS kind, NULL AS label, COUNT(*) AS cnt FROM Master_Shows
+                UNION ALL
+                SELECT 'status', recovery_status, cnt FROM status_counts
+                UNION ALL
+                SELECT 'genre', genre_name, cnt FROM genre_counts
+            """)
+            rows = cursor.fetchall()
+        
+        total_shows = next(cnt for kind, label, cnt in rows if kind == 'total')
         
         # Status breakdown
         status_stats = []
-        status_counts = MediaStatusLog.objects.values('recovery_status').annotate(
-            count=Count('show_id')
-        )
-        
-        for stat in status_counts:
-            status_stats.append({
-                'status': stat['recovery_status'],
-                'count': stat['count'],
-                'percentage': round((stat['count'] / total_shows) * 100, 2)
-            })
+        for kind, label, cnt in rows:
+            if kind == 'status':
+                status_stats.append({
+                    'status': label,
+                    'count': cnt,
+                    'percentage': round((cnt / total_shows) * 100, 2)
+                })
         
         # Unknown/Lost count (shows without status log)
         unknown_count = total_shows - sum(s['count'] for s in status_stats)
@@ -175,17 +308,20 @@ class MasterShowsViewSet(viewsets.ReadOnlyModelViewSet):
                 'percentage': round((unknown_count / total_shows) * 100, 2)
             })
         
-        # Genre distribution
-        genre_stats = ShowGenreMapping.objects.values(
-            'genre__genre_name'
-        ).annotate(
-            show_count=Count('show_id')
-        ).order_by('-show_count')[:10]
+        # Genre distribution (UNION ALL tidak menjamin urutan)
+        genre_stats = sorted(
+            (
+                {'genre__genre_name': label, 'show_count': cnt}
+                for kind, label, cnt in rows if kind == 'genre'
+            ),
+            key=lambda g: g['show_count'],
+            reverse=True
+        )
         
         return Response({
             'total_shows': total_shows,
             'status_distribution': status_stats,
-            'top_genres': list(genre_stats)
+            'top_genres': genre_stats
         })
 
 
@@ -205,17 +341,13 @@ def simple_search(request):
         }, status=status.HTTP_400_BAD_REQUEST)
     
     with connection.cursor() as cursor:
-        cursor.execute("""
-            EXEC SP_Search_By_Keyword @Keyword = %s
-        """, [keyword])
-        columns = [col[0] for col in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        # ODBC call escape: driver memanggil SP lewat RPC, tanpa parse batch EXEC
+        cursor.execute("{CALL SP_Search_By_Keyword (%s)}", [keyword])
+        paginator = StandardResultsSetPagination()
+        results = paginator.paginate_cursor(cursor, request)
     
     serializer = SearchResultSerializer(results, many=True)
-    return Response({
-        'count': len(results),
-        'results': serializer.data
-    })
+    return paginator.get_paginated_response(serializer.data)
 
 
 @api_view(['GET'])
@@ -237,21 +369,19 @@ def advanced_search(request):
                 @CategoryName = %s,
                 @RecoveryStatus = %s
         """, [keyword, title_type, genre_name, category_name, recovery_status])
-        columns = [col[0] for col in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        paginator = StandardResultsSetPagination()
+        results = paginator.paginate_cursor(cursor, request)
     
     serializer = SearchResultSerializer(results, many=True)
-    return Response({
-        'count': len(results),
-        'filters': {
-            'keyword': keyword,
-            'title_type': title_type,
-            'genre': genre_name,
-            'category': category_name,
-            'status': recovery_status
-        },
-        'results': serializer.data
-    })
+    response = paginator.get_paginated_response(serializer.data)
+    response.data['filters'] = {
+        'keyword': keyword,
+        'title_type': title_type,
+        'genre': genre_name,
+        'category': category_name,
+        'status': recovery_status
+    }
+    return response
 
 
 # ============================================================================
@@ -269,10 +399,11 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     def articles(self, request, slug=None):
         """Get articles by category"""
         category = self.get_object()
+        # Dilayani index (status, category_id, created_at DESC)
         articles = Article.objects.filter(
-            category=category,
+            category_id=category.pk,
             status='published'
-        ).select_related('user', 'category', 'show')
+        ).select_related('user', 'category', 'show').order_by('-created_at')
         
         paginator = StandardResultsSetPagination()
         page = paginator.paginate_queryset(articles, request)
@@ -307,17 +438,21 @@ class ArticleViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         queryset = self.queryset
         
+        # ArticleListSerializer tidak memakai content (TextField besar)
+        if self.action in ('list', 'my_articles'):
+            queryset = queryset.defer('content')
+        
         # Filter published articles for non-authenticated users
         if not self.request.user.is_authenticated:
             queryset = queryset.filter(status='published')
         else:
             # Contributors can see their own drafts
-            if self.request.user.role.name == 'Contributor':
+            if self.request.user.role_name == 'Contributor':
                 queryset = queryset.filter(
                     Q(status='published') | Q(user=self.request.user)
                 )
             # Admin can see all
-            elif self.request.user.role.name != 'Admin':
+            elif self.request.user.role_name != 'Admin':
                 queryset = queryset.filter(status='published')
         
         # Filter by category
@@ -338,9 +473,10 @@ class ArticleViewSet(viewsets.ModelViewSet):
     
     def perform_update(self, serializer):
         """Ensure only author or admin can update"""
-        article = self.get_object()
-        if article.user != self.request.user and self.request.user.role.name != 'Admin':
-            raise PermissionError("You don't have permission to edit this article")
+        # serializer.instance sudah diambil update() lewat get_object()
+        article = serializer.instance
+        if article.user_id != self.request.user.id and self.request.user.role_name != 'Admin':
+            raise PermissionDenied("You don't have permission to edit this article")
         serializer.save()
     
     @action(detail=False, methods=['get'])
@@ -366,6 +502,7 @@ class GenreViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = ListGenreSerializer
     permission_classes = [AllowAny]
     
+    @method_decorator(cache_page(STATS_CACHE_TIMEOUT, key_prefix='genres_stats'))
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """Get genre statistics"""
@@ -425,41 +562,43 @@ class MediaFileViewSet(viewsets.ModelViewSet):
 @permission_classes([IsAuthenticated])
 def dashboard_stats(request):
     """Statistics untuk dashboard (Executive/Admin)"""
-    
-    # Total counts
-    total_shows = MasterShows.objects.count()
-    total_articles = Article.objects.filter(status='published').count()
-    total_users = User.objects.count()
+    data = cache.get(DASHBOARD_STATS_CACHE_KEY)
+    if data is None:
+        data = _build_dashboard_stats()
+        cache.set(DASHBOARD_STATS_CACHE_KEY, data, DASHBOARD_STATS_TIMEOUT)
+    return Response(data)
+
+
+def _build_dashboard_stats():
+    """Hitung semua angka dashboard (di-cache oleh dashboard_stats)"""
+    # Total counts (tiga COUNT dalam satu round trip)
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM Master_Shows),
+                (SELECT COUNT(*) FROM articles WHERE status = %s),
+                (SELECT COUNT(*) FROM users)
+        """, ['published'])
+        total_shows, total_articles, total_users = cursor.fetchone()
     
     # Status distribution
     status_dist = MediaStatusLog.objects.values('recovery_status').annotate(
         count=Count('show_id')
     )
     
-    # Recent articles
+    # Recent articles (relasi sama dengan ArticleViewSet.queryset)
     recent_articles = Article.objects.filter(
         status='published'
-    ).select_related('user', 'category')[:5]
+    ).select_related('user', 'category', 'show').prefetch_related('media_files')[:5]
     
     # Top trending
-    with connection.cursor() as cursor:
-        cursor.execute("""
-            SELECT TOP 5
-                ms.Title,
-                ms.ReleaseYear,
-                mp.SearchCount
-            FROM dbo.Master_Shows AS ms
-            JOIN dbo.MediaPopularity AS mp ON ms.Show_ID = mp.ID
-            ORDER BY mp.SearchCount DESC
-        """)
-        columns = [col[0] for col in cursor.description]
-        trending = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    trending = _trending_shows(5)
     
-    return Response({
+    return {
         'total_shows': total_shows,
         'total_articles': total_articles,
         'total_users': total_users,
         'status_distribution': list(status_dist),
         'recent_articles': ArticleListSerializer(recent_articles, many=True).data,
         'trending_media': trending
-    })
\ No newline at end of file
+    }
\ No newline at end of file